@@ -1,6 +1,8 @@
 import numbers
-import bisect
+from functools import wraps
+from itertools import chain
 import math
+import os
 from warnings import warn
 
 import h5py
@@ -14,16 +16,28 @@ from openmc.exceptions import DataError
 
 __all__ = ["Results", "ResultsList"]
 
+# Files whose type and version have already been verified, identified by
+# absolute path, modification time, and size
+_VERIFIED_FILES = set()
+
+
+# Number of seconds in each supported time unit
+_TIME_DIVISOR = {"d": 60 * 60 * 24, "h": 60 * 60, "min": 60, "s": 1}
+
 
 def _get_time_as(seconds, units):
-    if units == "d":
-        return seconds / (60 * 60 * 24)
-    elif units == "h":
-        return seconds / (60 * 60)
-    elif units == "min":
-        return seconds / 60
-    else:
+    if units == "s":
         return seconds
+    return seconds / _TIME_DIVISOR[units]
+
+
+def _clears_cache(method):
+    """Wrap a list method so that it invalidates quantities cached on Results"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._clear_cache()
+        return method(self, *args, **kwargs)
+    return wrapper
 
 
 class Results(list):
@@ -36,22 +50,149 @@ class Results(list):
     Parameters
     ----------
     filename : str
-        Path to depletion result file
+        Path to depletion result file. The size of the HDF5 raw data chunk
+        cache used while reading it can be set in MiB through the
+        :envvar:`OPENMC_H5_CACHE_MB` environment variable.
+
+    .. note::
+        Quantities derived from the step results, such as time points and
+        atom numbers across steps, are cached. The cache is cleared whenever
+        the list itself is modified, but not when a :class:`StepResult` it
+        contains is modified in place. Replace the modified step, e.g.
+        ``results[i] = results[i]``, to have such changes picked up.
 
     """
     def __init__(self, filename=None):
         data = []
         if filename is not None:
-            with h5py.File(str(filename), "r") as fh:
-                cv.check_filetype_version(fh, 'depletion results', VERSION_RESULTS[0])
+            path = os.path.abspath(filename)
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+
+            # Every dataset is read in full exactly once, so the default raw
+            # data chunk cache is sufficient unless explicitly overridden
+            kwargs = {}
+            cache_mb = os.environ.get('OPENMC_H5_CACHE_MB')
+            if cache_mb is not None:
+                kwargs['rdcc_nbytes'] = int(float(cache_mb) * 1024 * 1024)
+
+            with h5py.File(path, "r", libver="latest", **kwargs) as fh:
+                # Skip the check if this file was already verified and has
+                # not been modified since
+                if key not in _VERIFIED_FILES:
+                    cv.check_filetype_version(
+                        fh, 'depletion results', VERSION_RESULTS[0])
+                    _VERIFIED_FILES.add(key)
+                data, number, rxn_rates = StepResult._from_hdf5_bulk(fh)
+        super().__init__(data)
 
-                # Get number of results stored
-                n = fh["number"][...].shape[0]
+        if filename is not None:
+            # The first stage of every step is available as a view into the
+            # arrays that were read, without stacking the steps again
+            self.__dict__['_cache'] = {
+                'atoms': number[:, 0], 'rates': rxn_rates[:, 0]}
+
+    # Any modification of the list invalidates cached quantities
+    __setitem__ = _clears_cache(list.__setitem__)
+    __delitem__ = _clears_cache(list.__delitem__)
+    __iadd__ = _clears_cache(list.__iadd__)
+    __imul__ = _clears_cache(list.__imul__)
+    append = _clears_cache(list.append)
+    extend = _clears_cache(list.extend)
+    insert = _clears_cache(list.insert)
+    pop = _clears_cache(list.pop)
+    remove = _clears_cache(list.remove)
+    clear = _clears_cache(list.clear)
+    sort = _clears_cache(list.sort)
+    reverse = _clears_cache(list.reverse)
+
+    def _clear_cache(self):
+        """Discard quantities derived from the list of step results"""
+        self.__dict__.pop('_cache', None)
+
+    def _get_cached(self, key, func):
+        """Return a quantity derived from the step results, computing it with
+        ``func`` only if it has not been cached yet"""
+        cache = self.__dict__.setdefault('_cache', {})
+        if key not in cache:
+            cache[key] = func()
+        return cache[key]
+
+    @property
+    def _atoms_cube(self):
+        """Atom numbers at the first stage of every step, indexed by step,
+        material, then nuclide"""
+        return self._get_cached(
+            'atoms', lambda: np.stack([r.data[0] for r in self]))
+
+    def _rate_history(self, rate_ix):
+        """Return the reaction rate at the first stage of every step
 
-                for i in range(n):
-                    data.append(StepResult.from_hdf5(fh, i))
-        super().__init__(data)
+        Parameters
+        ----------
+        rate_ix : tuple of int
+            Material, nuclide, and reaction indices into the reaction rates
 
+        Returns
+        -------
+        numpy.ndarray
+            Reaction rate for each step
+
+        """
+        rates = self.__dict__.get('_cache', {}).get('rates')
+        if rates is not None:
+            return rates[(slice(None),) + rate_ix]
+
+        # Only gather the requested values for results that were not loaded
+        # from a file
+        return np.fromiter(
+            (r.rates[0][rate_ix] for r in self), dtype=float, count=len(self))
+
+    @property
+    def _k_cube(self):
+        """Eigenvalue and uncertainty at the first stage of every step"""
+        if not self:
+            return np.empty((0, 2))
+        return self._get_cached(
+            'k', lambda: np.stack([r.k[0] for r in self]))
+
+    def _resolve(self, mat_id, nuc, rx=None):
+        """Return array indices for a material, nuclide, and reaction
+
+        All steps share the same indexing, so indices are looked up once
+        from the first step and can then be used on every step.
+
+        Parameters
+        ----------
+        mat_id : str
+            Material id
+        nuc : str
+            Nuclide name
+        rx : str, optional
+            Reaction name
+
+        Returns
+        -------
+        mat_ix : int
+            Material index into :attr:`StepResult.data`
+        nuc_ix : int
+            Nuclide index into :attr:`StepResult.data`
+        rate_ix : tuple of int
+            Material, nuclide, and reaction indices into
+            :attr:`StepResult.rates`. Only returned if ``rx`` is given.
+
+        """
+        first = self[0]
+        mat_ix = first.mat_to_ind[mat_id]
+        nuc_ix = first.nuc_to_ind[nuc]
+        if rx is None:
+            return mat_ix, nuc_ix
+
+        # Reaction rates are indexed separately from atom numbers
+        rates = first.rates[0]
+        rate_ix = (rates.index_mat[mat_id], rates.index_nuc[nuc],
+                   rates.index_rx[rx])
+        return mat_ix, nuc_ix, rate_ix
 
     @classmethod
     def from_hdf5(cls, filename):
@@ -119,22 +260,25 @@ class Results(list):
             mat_id = mat
         else:
             raise TypeError('mat should be of type openmc.Material or str')
-        times = np.empty_like(self, dtype=float)
-        concentrations = np.empty_like(self, dtype=float)
 
-        # Evaluate value in each region
-        for i, result in enumerate(self):
-            times[i] = result.time[0]
-            concentrations[i] = result[0, mat_id, nuc]
+        # No steps to evaluate
+        if not self:
+            return np.empty(0), np.empty(0)
+
+        mat_ix, nuc_ix = self._resolve(mat_id, nuc)
 
-        # Unit conversions
-        times = _get_time_as(times, time_units)
+        # Unit conversions, combined into a single scaling factor
+        scale = 1.0
         if nuc_units != "atoms":
             # Divide by volume to get density
-            concentrations /= self[0].volume[mat_id]
+            scale /= self[0].volume[mat_id]
             if nuc_units == "atom/b-cm":
                 # 1 barn = 1e-24 cm^2
-                concentrations *= 1e-24
+                scale *= 1e-24
+
+        # Evaluate value in each region
+        times = self.get_times(time_units)
+        concentrations = self._atoms_cube[:, mat_ix, nuc_ix] * scale
 
         return times, concentrations
 
@@ -166,9 +310,6 @@ class Results(list):
             Array of reaction rates
 
         """
-        times = np.empty_like(self, dtype=float)
-        rates = np.empty_like(self, dtype=float)
-
         if isinstance(mat, Material):
             mat_id = str(mat.id)
         elif isinstance(mat, str):
@@ -176,10 +317,15 @@ class Results(list):
         else:
             raise TypeError('mat should be of type openmc.Material or str')
 
+        # No steps to evaluate
+        if not self:
+            return np.empty(0), np.empty(0)
+
+        mat_ix, nuc_ix, rate_ix = self._resolve(mat_id, nuc, rx)
+
         # Evaluate value in each region
-        for i, result in enumerate(self):
-            times[i] = result.time[0]
-            rates[i] = result.rates[0].get(mat_id, nuc, rx) * result[0, mat, nuc]
+        times = self.get_times("s")
+        rates = self._rate_history(rate_ix) * self._atoms_cube[:, mat_ix, nuc_ix]
 
         return times, rates
 
@@ -205,16 +351,9 @@ class Results(list):
         """
         cv.check_value("time_units", time_units, {"s", "d", "min", "h"})
 
-        times = np.empty_like(self, dtype=float)
-        eigenvalues = np.empty((len(self), 2), dtype=float)
-
         # Get time/eigenvalue at each point
-        for i, result in enumerate(self):
-            times[i] = result.time[0]
-            eigenvalues[i] = result.k[0]
-
-        # Convert time units if necessary
-        times = _get_time_as(times, time_units)
+        times = self.get_times(time_units)
+        eigenvalues = self._k_cube.copy()
         return times, eigenvalues
 
     def get_eigenvalue(self, time_units='s'):
@@ -237,18 +376,17 @@ class Results(list):
             across all processes and materials.
 
         """
-        times = np.empty(len(self) - 1)
         # Need special logic because the predictor
         # writes EOS values for step i as BOS values
         # for step i+1
         # The first proc_time may be zero
-        if self[0].proc_time > 0.0:
-            items = self[:-1]
-        else:
-            items = self[1:]
-        for ix, res in enumerate(items):
-            times[ix] = res.proc_time
-        return times
+        offset = 0 if self[0].proc_time > 0.0 else 1
+        n = len(self) - 1
+        return np.fromiter(
+            (self[i].proc_time for i in range(offset, offset + n)),
+            dtype=np.float64,
+            count=n,
+        )
 
     def get_times(self, time_units="d") -> np.ndarray:
         """Return the points in time that define the depletion schedule
@@ -266,16 +404,24 @@ class Results(list):
         numpy.ndarray
             1-D vector of time points
 
+        """
+        return self._get_times(time_units).copy()
+
+    def _get_times(self, time_units):
+        """Return the cached time points in the requested units
+
+        The returned array is shared between calls and must not be modified.
+
         """
         cv.check_value("time_units", time_units, {"s", "d", "min", "h"})
 
-        times = np.fromiter(
-            (r.time[0] for r in self),
-            dtype=self[0].time.dtype,
-            count=len(self),
-        )
+        def compute():
+            times = np.fromiter(
+                (r.time[0] for r in self), dtype=float, count=len(self),
+            )
+            return _get_time_as(times, time_units)
 
-        return _get_time_as(times, time_units)
+        return self._get_cached(('times', time_units), compute)
 
     def get_step_where(
         self, time, time_units="d", atol=1e-6, rtol=1e-3
@@ -313,10 +459,10 @@ class Results(list):
         cv.check_type("atol", atol, numbers.Real)
         cv.check_type("rtol", rtol, numbers.Real)
 
-        times = self.get_times(time_units)
+        times = self._get_times(time_units)
 
         if times[0] < time < times[-1]:
-            ix = bisect.bisect_left(times, time)
+            ix = int(np.searchsorted(times, time, side="left"))
             if ix == times.size:
                 ix -= 1
             # Bisection will place us either directly on the point
@@ -337,6 +483,110 @@ class Results(list):
                 time, time_units, atol, rtol)
         )
 
+    def get_steps_where(
+        self, times, time_units="d", atol=1e-6, rtol=1e-3
+    ) -> np.ndarray:
+        """Return the indices closest to several points in time
+
+        This is a vectorized form of :meth:`get_step_where` and follows
+        the same rules for selecting indices and applying tolerances.
+
+        .. versionadded:: 0.13.1
+
+        Parameters
+        ----------
+        times : iterable of float
+            Desired points in time
+        time_units : {"s", "d", "min", "h"}, optional
+            Units on ``times``. Default: days
+        atol : float, optional
+            Absolute tolerance (in ``time_units``) if a time is not
+            found.
+        rtol : float, optional
+            Relative tolerance if a time is not found.
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the closest step for each point in ``times``
+
+        """
+        cv.check_type("atol", atol, numbers.Real)
+        cv.check_type("rtol", rtol, numbers.Real)
+        # Tolerances must be non-negative as required by math.isclose
+        cv.check_greater_than("atol", atol, 0.0, equality=True)
+        cv.check_greater_than("rtol", rtol, 0.0, equality=True)
+
+        targets = np.asarray(times, dtype=float)
+        step_times = self._get_times(time_units)
+
+        if step_times.size == 1:
+            ix = np.zeros(targets.shape, dtype=int)
+        else:
+            # Choose between the points on either side of each target,
+            # preferring the lower index at the exact mid-point
+            ix = np.searchsorted(step_times, targets, side="left")
+            ix = np.clip(ix, 1, step_times.size - 1)
+            lower = targets - step_times[ix - 1] <= step_times[ix] - targets
+            ix[lower] -= 1
+
+        # Same comparison as math.isclose
+        closest = step_times[ix]
+        with np.errstate(invalid="ignore"):
+            tol = np.maximum(
+                rtol * np.maximum(np.abs(targets), np.abs(closest)), atol)
+            found = (targets == closest) | (np.abs(targets - closest) <= tol)
+
+        if not np.all(found):
+            raise ValueError(
+                "Values of {} {} were not found given absolute and "
+                "relative tolerances {} and {}.".format(
+                    targets[~found], time_units, atol, rtol)
+            )
+        return ix
+
+    def _available_xs(self, cross_sections=None):
+        """Return nuclides with neutron data in a cross section library
+
+        Parsed libraries are cached by path, modification time, and size so
+        that repeated calls to :meth:`export_to_materials` do not reread an
+        unchanged file.
+
+        Parameters
+        ----------
+        cross_sections : str, optional
+            Path to cross_sections.xml file. If not provided, the
+            :envvar:`OPENMC_CROSS_SECTIONS` environment variable will be used.
+
+        Returns
+        -------
+        frozenset of str
+            Names of nuclides with neutron data
+
+        """
+        path = cross_sections
+        if path is None:
+            path = os.environ.get('OPENMC_CROSS_SECTIONS')
+        if path is None:
+            # No library to cache, let DataLibrary report the missing path
+            DataLibrary.from_xml()
+
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        cache = self.__dict__.setdefault('_xs_cache', {})
+        if key not in cache:
+            this_library = DataLibrary.from_xml(path=cross_sections)
+
+            # Find neutron libraries we have access to
+            available = frozenset(chain.from_iterable(
+                lib['materials'] for lib in this_library.libraries
+                if lib['type'] == 'neutron'
+            ))
+            if not available:
+                raise DataError('No neutron libraries found in cross_sections.xml')
+            cache[key] = available
+        return cache[key]
+
     def export_to_materials(self, burnup_index, nuc_with_data=None) -> Materials:
         """Return openmc.Materials object based on results at a given step
 
@@ -377,37 +627,36 @@ class Results(list):
         # the environment variable OPENMC_CROSS_SECTIONS.
         if nuc_with_data:
             cv.check_iterable_type('nuclide names', nuc_with_data, str)
-            available_cross_sections = nuc_with_data
+            available_cross_sections = frozenset(nuc_with_data)
         else:
-            # select cross_sections.xml file to use
-            if mat_file.cross_sections:
-                this_library = DataLibrary.from_xml(path=mat_file.cross_sections)
-            else:
-                this_library = DataLibrary.from_xml()
+            available_cross_sections = self._available_xs(
+                mat_file.cross_sections)
 
-            # Find neutron libraries we have access to
-            available_cross_sections = set()
-            for lib in this_library.libraries:
-                if lib['type'] == 'neutron':
-                    available_cross_sections.update(lib['materials'])
-            if not available_cross_sections:
-                raise DataError('No neutron libraries found in cross_sections.xml')
+        # Determine once which depleted nuclides have transport data, along
+        # with their indices, so that each material only visits those
+        nuc_to_ind = result.nuc_to_ind
+        write_pairs = [(nuc, ind) for nuc, ind in nuc_to_ind.items()
+                       if nuc in available_cross_sections]
+        nuc_names = np.array([nuc for nuc, _ in write_pairs], dtype=object)
+        nuc_idx = np.array([ind for _, ind in write_pairs], dtype=np.intp)
+
+        # Map integer material IDs to their index and volume in the results
+        id_to_row = {int(mat_id): (ind, result.volume[mat_id])
+                     for mat_id, ind in result.mat_to_ind.items()}
 
         # Overwrite material definitions, if they can be found in the depletion
         # results, and save them to the new depleted xml file.
         for mat in mat_file:
-            mat_id = str(mat.id)
-            if mat_id in result.mat_to_ind:
-                mat.volume = result.volume[mat_id]
-                mat.set_density('sum')
-                for nuc in result.nuc_to_ind:
-                    if nuc not in available_cross_sections:
-                        continue
-                    atoms = result[0, mat_id, nuc]
-                    if atoms > 0.0:
-                        atoms_per_barn_cm = 1e-24 * atoms / mat.volume
-                        mat.remove_nuclide(nuc) # Replace if it's there
-                        mat.add_nuclide(nuc, atoms_per_barn_cm)
+            row = id_to_row.get(mat.id)
+            if row is None:
+                continue
+            mat_ix, volume = row
+            mat.volume = volume
+            mat.set_density('sum')
+            atoms = result.get_by_index(0, mat_ix, nuc_idx)
+            keep = atoms > 0.0
+            atoms_per_barn_cm = 1e-24 * atoms[keep] / mat.volume
+            mat.set_nuclides(nuc_names[keep], atoms_per_barn_cm)
 
         return mat_file
 
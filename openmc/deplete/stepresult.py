@@ -20,6 +20,26 @@ VERSION_RESULTS = (1, 1)
 __all__ = ["StepResult"]
 
 
+def _read_dataset(dset):
+    """Read an entire HDF5 dataset into a newly allocated contiguous array
+
+    Parameters
+    ----------
+    dset : h5py.Dataset
+        Dataset to read
+
+    Returns
+    -------
+    numpy.ndarray
+        Contents of the dataset
+
+    """
+    buf = np.empty(dset.shape, dtype=dset.dtype)
+    if buf.size > 0:
+        dset.read_direct(buf)
+    return buf
+
+
 class StepResult:
     """Result of a single depletion timestep
 
@@ -123,6 +143,55 @@ class StepResult:
 
         self.data[stage, mat, nuc] = val
 
+    def get_by_index(self, stage, mat, nuc):
+        """Retrieves atoms from results using integer indices only.
+
+        Unlike :meth:`__getitem__`, no lookup of material IDs or nuclide names
+        is performed, making this suitable for repeated access once indices
+        have been resolved through :attr:`mat_to_ind` and :attr:`nuc_to_ind`.
+
+        Parameters
+        ----------
+        stage : int or slice
+            Stage index
+        mat : int, slice, or numpy.ndarray
+            Material index
+        nuc : int, slice, or numpy.ndarray
+            Nuclide index
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The atoms for stage, mat, nuc
+
+        """
+        return self.data[stage, mat, nuc]
+
+    def get_rate_by_index(self, stage, mat, nuc, rx):
+        """Retrieves a reaction rate using integer indices only.
+
+        Indices must be resolved through the ``index_mat``, ``index_nuc``, and
+        ``index_rx`` attributes of the :class:`ReactionRates` in :attr:`rates`.
+
+        Parameters
+        ----------
+        stage : int
+            Stage index
+        mat : int, slice, or numpy.ndarray
+            Material index
+        nuc : int, slice, or numpy.ndarray
+            Nuclide index
+        rx : int, slice, or numpy.ndarray
+            Reaction index
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The reaction rate for stage, mat, nuc, rx
+
+        """
+        return self.rates[stage][mat, nuc, rx]
+
     @property
     def n_mat(self):
         return len(self.mat_to_ind)
@@ -423,22 +492,143 @@ class StepResult:
             results.proc_time = np.array([np.nan])
 
         # Reconstruct dictionaries
-        results.volume = OrderedDict()
-        results.mat_to_ind = OrderedDict()
-        results.nuc_to_ind = OrderedDict()
+        (results.volume, results.mat_to_ind, results.nuc_to_ind,
+         rxn_nuc_to_ind, rxn_to_ind) = cls._read_hdf5_indices(handle)
+
+        results.rates = []
+        # Reconstruct reactions
+        for i in range(results.n_stages):
+            rate = ReactionRates(results.mat_to_ind, rxn_nuc_to_ind, rxn_to_ind, True)
+
+            rate[:] = handle["/reaction rates"][step, i, :, :, :]
+            results.rates.append(rate)
+
+        return results
+
+    @classmethod
+    def from_hdf5_bulk(cls, handle):
+        """Loads results objects for every step from HDF5.
+
+        Each dataset is read from the file once and then sliced in memory
+        along the step axis, rather than issuing separate reads for every
+        step as :meth:`from_hdf5` does.
+
+        Parameters
+        ----------
+        handle : h5py.File or h5py.Group
+            An HDF5 file or group type to load from.
+
+        Returns
+        -------
+        list of StepResult
+            Results for each depletion step
+
+        """
+        return cls._from_hdf5_bulk(handle)[0]
+
+    @classmethod
+    def _from_hdf5_bulk(cls, handle):
+        """Loads results objects for every step along with the full arrays.
+
+        Parameters
+        ----------
+        handle : h5py.File or h5py.Group
+            An HDF5 file or group type to load from.
+
+        Returns
+        -------
+        steps : list of StepResult
+            Results for each depletion step
+        number : numpy.ndarray
+            Atom numbers of all steps, indexed by step, stage, material, then
+            nuclide. The :attr:`data` of each step is a view into this array.
+        rxn_rates : numpy.ndarray
+            Reaction rates of all steps, indexed by step, stage, material,
+            nuclide, then reaction. The :attr:`rates` of each step are views
+            into this array.
+
+        """
+        number = _read_dataset(handle["/number"])
+        eigenvalues = _read_dataset(handle["/eigenvalues"])
+        time = _read_dataset(handle["/time"])
+        if "source_rate" in handle:
+            source_rate = _read_dataset(handle["/source_rate"])
+        else:
+            # Older versions used "power" instead of "source_rate"
+            source_rate = _read_dataset(handle["/power"])
+        rxn_rates = _read_dataset(handle["/reaction rates"])
+        if "depletion time" in handle:
+            proc_time = _read_dataset(handle["/depletion time"])
+        else:
+            proc_time = np.empty(0)
+
+        # Indexing dictionaries are identical for every step
+        (volume, mat_to_ind, nuc_to_ind,
+         rxn_nuc_to_ind, rxn_to_ind) = cls._read_hdf5_indices(handle)
+
+        steps = []
+        for step in range(number.shape[0]):
+            results = cls()
+            results.data = number[step]
+            results.k = eigenvalues[step]
+            results.time = time[step]
+            results.source_rate = source_rate[step, 0]
+            if step < proc_time.shape[0]:
+                results.proc_time = proc_time[step]
+            else:
+                results.proc_time = np.array([np.nan])
+
+            results.volume = volume
+            results.mat_to_ind = mat_to_ind
+            results.nuc_to_ind = nuc_to_ind
+
+            results.rates = []
+            for i in range(results.n_stages):
+                rate = rxn_rates[step, i].view(ReactionRates)
+                rate.index_mat = mat_to_ind
+                rate.index_nuc = rxn_nuc_to_ind
+                rate.index_rx = rxn_to_ind
+                results.rates.append(rate)
+
+            steps.append(results)
+
+        return steps, number, rxn_rates
+
+    @staticmethod
+    def _read_hdf5_indices(handle):
+        """Reads the indexing dictionaries shared by all steps from HDF5.
+
+        Parameters
+        ----------
+        handle : h5py.File or h5py.Group
+            An HDF5 file or group type to load from.
+
+        Returns
+        -------
+        volume : OrderedDict of str to float
+            Dictionary mapping mat id to volume
+        mat_to_ind : OrderedDict of str to int
+            Dictionary mapping mat id to index
+        nuc_to_ind : OrderedDict of str to int
+            Dictionary mapping nuclide name to atom number index
+        rxn_nuc_to_ind : OrderedDict of str to int
+            Dictionary mapping nuclide name to reaction rate index
+        rxn_to_ind : OrderedDict of str to int
+            Dictionary mapping reaction name to index
+
+        """
+        volume = OrderedDict()
+        mat_to_ind = OrderedDict()
+        nuc_to_ind = OrderedDict()
         rxn_nuc_to_ind = OrderedDict()
         rxn_to_ind = OrderedDict()
 
         for mat, mat_handle in handle["/materials"].items():
-            vol = mat_handle.attrs["volume"]
-            ind = mat_handle.attrs["index"]
-
-            results.volume[mat] = vol
-            results.mat_to_ind[mat] = ind
+            volume[mat] = mat_handle.attrs["volume"]
+            mat_to_ind[mat] = mat_handle.attrs["index"]
 
         for nuc, nuc_handle in handle["/nuclides"].items():
-            ind_atom = nuc_handle.attrs["atom number index"]
-            results.nuc_to_ind[nuc] = ind_atom
+            nuc_to_ind[nuc] = nuc_handle.attrs["atom number index"]
 
             if "reaction rate index" in nuc_handle.attrs:
                 rxn_nuc_to_ind[nuc] = nuc_handle.attrs["reaction rate index"]
@@ -446,15 +636,7 @@ class StepResult:
         for rxn, rxn_handle in handle["/reactions"].items():
             rxn_to_ind[rxn] = rxn_handle.attrs["index"]
 
-        results.rates = []
-        # Reconstruct reactions
-        for i in range(results.n_stages):
-            rate = ReactionRates(results.mat_to_ind, rxn_nuc_to_ind, rxn_to_ind, True)
-
-            rate[:] = handle["/reaction rates"][step, i, :, :, :]
-            results.rates.append(rate)
-
-        return results
+        return volume, mat_to_ind, nuc_to_ind, rxn_nuc_to_ind, rxn_to_ind
 
     @staticmethod
     def save(op, x, op_results, t, source_rate, step_ind, proc_time=None):
@@ -403,6 +403,52 @@ class Material(IDManagerMixin):
 
         self._nuclides.append(NuclideTuple(nuclide, percent, percent_type))
 
+    def set_nuclides(self, nuclides: typing.Iterable[str],
+                     percents: typing.Iterable[float], percent_type: str = 'ao'):
+        """Add several nuclides to the material, replacing existing entries
+
+        Any nuclides already present in the material with one of the given
+        names are removed first. This is equivalent to calling
+        :meth:`remove_nuclide` followed by :meth:`add_nuclide` for each
+        nuclide but only walks the list of nuclides once. All arguments are
+        checked before the material is modified.
+
+        .. versionadded:: 0.13.1
+
+        Parameters
+        ----------
+        nuclides : iterable of str
+            Nuclides to add, e.g., ['U235', 'U238']. Each name may only
+            appear once.
+        percents : iterable of float
+            Atom or weight percent for each nuclide
+        percent_type : {'ao', 'wo'}
+            'ao' for atom percent and 'wo' for weight percent
+
+        """
+        nuclides = list(nuclides)
+        percents = list(percents)
+        if len(nuclides) != len(percents):
+            raise ValueError('The number of nuclides and percents must match')
+        for nuclide, percent in zip(nuclides, percents):
+            cv.check_type('nuclide', nuclide, str)
+            cv.check_type('percent', percent, Real)
+        cv.check_value('percent type', percent_type, {'ao', 'wo'})
+
+        replaced = set(nuclides)
+        if len(replaced) != len(nuclides):
+            raise ValueError('Each nuclide may only be given once')
+
+        if self._macroscopic is not None:
+            msg = 'Unable to add a Nuclide to Material ID="{}" as a ' \
+                  'macroscopic data-set has already been added'.format(self._id)
+            raise ValueError(msg)
+
+        self._nuclides = [nuc for nuc in self._nuclides
+                          if nuc.name not in replaced]
+        for nuclide, percent in zip(nuclides, percents):
+            self.add_nuclide(nuclide, percent, percent_type)
+
     def remove_nuclide(self, nuclide: str):
         """Remove a nuclide from the material
 
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 from math import inf
+import os
+import shutil
 
 import numpy as np
 import pytest
@@ -131,3 +133,155 @@ def test_get_steps(unit):
     actual = results.get_step_where(
         times[-1] * 100, time_units=unit, atol=inf, rtol=inf)
     assert actual == times.size - 1
+
+
+def test_get_times_cache(res):
+    """Tests that cached times are protected and track list changes."""
+    times = res.get_times("s")
+    np.testing.assert_allclose(
+        times, [0.0, 1296000.0, 2592000.0, 3888000.0])
+
+    # Modifying the returned array must not change subsequent calls
+    times[:] = -1.0
+    assert res.get_times("s")[0] == 0.0
+
+    # Modifying the list must invalidate cached times
+    res.pop()
+    assert res.get_times("s").size == 3
+    assert res.get_step_where(30, time_units="d") == 2
+
+
+def test_get_by_index(res):
+    """Tests integer-indexed access on a single step."""
+    result = res[1]
+    mat_ix = result.mat_to_ind["1"]
+    nuc_ix = result.nuc_to_ind["Xe135"]
+    assert result.get_by_index(0, mat_ix, nuc_ix) == result[0, "1", "Xe135"]
+
+    rates = result.rates[0]
+    rate_ix = (rates.index_mat["1"], rates.index_nuc["Xe135"],
+               rates.index_rx["(n,gamma)"])
+    assert (result.get_rate_by_index(0, *rate_ix)
+            == rates.get("1", "Xe135", "(n,gamma)"))
+
+
+def test_get_steps_where(res):
+    """Tests vectorized lookup of step indices."""
+    # Times in days are 0, 15, 30, 45
+    targets = [0.0, 15.0, 22.5, 29.0, 45.0, 100.0]
+    ix = res.get_steps_where(targets, time_units="d", atol=inf, rtol=inf)
+    np.testing.assert_array_equal(ix, [0, 1, 1, 2, 3, 3])
+    for target, expected in zip(targets, ix):
+        assert res.get_step_where(
+            target, time_units="d", atol=inf, rtol=inf) == expected
+
+    np.testing.assert_array_equal(
+        res.get_steps_where([15.0, 30.0], atol=0, rtol=0), [1, 2])
+    with pytest.raises(ValueError):
+        res.get_steps_where([15.0, 31.0], atol=0, rtol=0)
+
+    # Negative tolerances are rejected as in get_step_where
+    for atol, rtol in [(-1.0, 0.0), (0.0, -1.0)]:
+        with pytest.raises(ValueError):
+            res.get_step_where(15.0, atol=atol, rtol=rtol)
+        with pytest.raises(ValueError):
+            res.get_steps_where([15.0], atol=atol, rtol=rtol)
+
+
+def test_results_built_by_hand(res):
+    """Tests that Results assembled from steps match those read from file."""
+    built = openmc.deplete.Results()
+    built.extend(res)
+
+    for func, args in [("get_atoms", ("1", "Xe135")),
+                       ("get_reaction_rate", ("1", "Xe135", "(n,gamma)")),
+                       ("get_keff", ())]:
+        for expected, actual in zip(getattr(res, func)(*args),
+                                    getattr(built, func)(*args)):
+            np.testing.assert_allclose(actual, expected)
+
+    # Replacing a step modified in place invalidates cached values
+    step = built[1]
+    step[0, "1", "Xe135"] = 1.0
+    built[1] = step
+    _, n = built.get_atoms("1", "Xe135")
+    assert n[1] == 1.0
+
+
+def test_empty_results():
+    """Tests that getters on empty results return empty arrays."""
+    results = openmc.deplete.Results()
+
+    t, n = results.get_atoms("1", "Xe135")
+    assert t.shape == n.shape == (0,)
+
+    t, r = results.get_reaction_rate("1", "Xe135", "(n,gamma)")
+    assert t.shape == r.shape == (0,)
+
+    t, k = results.get_keff()
+    assert t.shape == (0,)
+    assert k.shape == (0, 2)
+
+
+def test_available_xs_cache(res, run_in_tmpdir, monkeypatch):
+    """Tests that cross section libraries are only parsed when needed."""
+    def write_library(path, nuclides):
+        with open(path, 'w') as fh:
+            fh.write("<?xml version='1.0'?>\n<cross_sections>\n")
+            fh.write('  <library materials="{}" path="lib.h5" '
+                     'type="neutron"/>\n'.format(' '.join(nuclides)))
+            fh.write('</cross_sections>\n')
+
+    calls = []
+    from_xml = openmc.data.DataLibrary.from_xml
+
+    def counting_from_xml(path=None):
+        calls.append(path)
+        return from_xml(path)
+
+    monkeypatch.setattr(openmc.deplete.results.DataLibrary, 'from_xml',
+                        counting_from_xml)
+
+    write_library('a.xml', ['U235'])
+    write_library('b.xml', ['U238', 'Xe135'])
+
+    assert res._available_xs('a.xml') == {'U235'}
+    assert res._available_xs('a.xml') == {'U235'}
+    assert len(calls) == 1
+
+    # A different path is parsed separately
+    assert res._available_xs('b.xml') == {'U238', 'Xe135'}
+    assert len(calls) == 2
+
+    # Modifying a file invalidates its cached library
+    write_library('a.xml', ['U235', 'U238'])
+    assert res._available_xs('a.xml') == {'U235', 'U238'}
+    assert len(calls) == 3
+
+
+def test_filetype_check_cache(run_in_tmpdir, monkeypatch):
+    """Tests that unchanged result files are only checked once."""
+    reference = (Path(__file__).parents[1] / 'regression_tests' / 'deplete'
+                 / 'test_reference.h5')
+    filename = Path('results.h5')
+    shutil.copy(reference, filename)
+
+    calls = []
+    check = openmc.checkvalue.check_filetype_version
+
+    def counting_check(*args, **kwargs):
+        calls.append(args)
+        return check(*args, **kwargs)
+
+    monkeypatch.setattr(openmc.checkvalue, 'check_filetype_version',
+                        counting_check)
+
+    openmc.deplete.Results(filename)
+    openmc.deplete.Results(filename)
+    assert len(calls) == 1
+
+    # A modified file is checked again
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    openmc.deplete.Results(filename)
+    assert len(calls) == 2
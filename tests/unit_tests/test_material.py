@@ -38,6 +38,30 @@ def test_remove_nuclide():
     assert m.nuclides[1].percent == 2.0
 
 
+def test_set_nuclides():
+    """Test adding/replacing several nuclides at once."""
+    m = openmc.Material()
+    for nuc, percent in [('H1', 1.0), ('O16', 1.0), ('H1', 2.0)]:
+        m.add_nuclide(nuc, percent)
+    m.set_nuclides(['H1', 'H2'], [3.0, 4.0])
+    assert [nuc.name for nuc in m.nuclides] == ['O16', 'H1', 'H2']
+    assert [nuc.percent for nuc in m.nuclides] == [1.0, 3.0, 4.0]
+
+    # Invalid input must leave the material unchanged
+    before = list(m.nuclides)
+    with pytest.raises(ValueError):
+        m.set_nuclides(['H1'], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        m.set_nuclides(['H1', 'H1'], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        m.set_nuclides(['H1'], [1.0], 'oa')
+    with pytest.raises(TypeError):
+        m.set_nuclides(['H1', 'H2'], [1.0, '1.0'])
+    with pytest.raises(TypeError):
+        m.set_nuclides(['H1', 1.0], [1.0, 2.0])
+    assert m.nuclides == before
+
+
 def test_remove_elements():
     """Test removing elements."""
     m = openmc.Material()